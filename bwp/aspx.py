@@ -0,0 +1,39 @@
+# Helpers shared by spiders that drive ASP.NET WebForms postback pages.
+
+import functools
+import re
+
+_RE_POSTBACK = re.compile(
+    r"WebForm_DoPostBackWithOptions\(new WebForm_PostBackOptions\((?P<opts>.*)\)\)"
+    r"|__doPostBack\((?P<args>.*)\)"
+)
+
+
+@functools.lru_cache(maxsize=8192)
+def extract_link_args(js_code):
+    """
+    Extract arguments from JavaScript postback functions in links.
+
+    Parses both WebForm_PostBackOptions and __doPostBack JavaScript
+    function calls to extract their arguments. Results are cached since
+    the sites emit the same postback links for many rows and pages.
+
+    Args:
+        js_code (str): JavaScript link containing postback function call
+
+    Returns:
+        tuple: Extracted and cleaned arguments from the JavaScript function
+             Returns empty tuple if no arguments found
+    """
+    if not js_code:
+        return ()
+
+    match = _RE_POSTBACK.search(js_code)
+    if not match:
+        return ()
+
+    args = match.group("opts")
+    if args is None:
+        args = match.group("args")
+
+    return tuple(arg.strip("\"' ") for arg in args.split(","))
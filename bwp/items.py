@@ -2,27 +2,34 @@
 #
 # See documentation in:
 # https://docs.scrapy.org/en/latest/topics/items.html
+#
+# Items are slotted dataclasses rather than scrapy.Item subclasses: Scrapy
+# supports them natively and they are cheaper to build and export.
 
-import scrapy
+from dataclasses import dataclass
 
 
-class PdfItem(scrapy.Item):
-    name = scrapy.Field()
-    link_args = scrapy.Field()
+@dataclass(slots=True)
+class PdfItem:
+    name: str | None
+    link_args: tuple[str, ...]
 
 
-class ExcelItem(scrapy.Item):
-    name = scrapy.Field()
-    link_args = scrapy.Field()
+@dataclass(slots=True)
+class ExcelItem:
+    name: str | None
+    link_args: tuple[str, ...]
 
 
-class PostingItem(scrapy.Item):
-    index = scrapy.Field()
-    posting_date = scrapy.Field()
+@dataclass(slots=True)
+class PostingItem:
+    index: int
+    posting_date: str
 
-    pdf = scrapy.Field(serializer=PdfItem)
-    excel = scrapy.Field(serializer=ExcelItem)
+    pdf: PdfItem
+    excel: ExcelItem
 
 
-class FercItem(scrapy.Item):
-    checksum = scrapy.Field()
+@dataclass(slots=True)
+class FercItem:
+    checksum: str
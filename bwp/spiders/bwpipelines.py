@@ -1,12 +1,132 @@
 import mimetypes
 import re
-import time
 import scrapy
 import os
+from pathlib import Path
+from urllib.parse import urlencode, urljoin
+from lxml.etree import XPath
+from scrapy.utils.defer import maybe_deferred_to_future
+from twisted.internet.threads import deferToThread
 
 from bwp import settings
+from bwp.aspx import extract_link_args
 from bwp.items import PostingItem, ExcelItem, PdfItem
 
+# Page-level XPath expressions are compiled once at import; row cells are
+# read by walking the lxml tree directly (see _link_parts)
+_HIDDEN_INPUTS = XPath("//input[@type='hidden']")
+_TABLE_ROWS = XPath("//table[@id='dgITMatrix']/tr[starts-with(@id, 'dgITMatrix_')]")
+_NEXT_PAGE_HREF = XPath(
+    "//table[@id='dgITMatrix']//tr[1]//a[re:test(text(), 'next', 'i')]/@href",
+    namespaces={"re": "http://exslt.org/regular-expressions"},
+)
+
+_RE_FILENAME = re.compile(r'filename\*?=["\']?(?:UTF-8\'\')?([^"\']+)')
+_RE_UNSAFE_CHARS = re.compile(r'[\\/:"*?<>|]')
+
+
+def _first(xpath, node):
+    """Return the first result of a compiled XPath as a plain str, or None."""
+    result = xpath(node)
+    return str(result[0]) if result else None
+
+
+def _cell(cells, position):
+    """Return the cell at the given position of a row, or None if the row is short."""
+    return cells[position] if len(cells) > position else None
+
+
+def _link_text(link):
+    """Return the first text node directly inside a link, or None."""
+    if link.text is not None:
+        return link.text
+    return next((child.tail for child in link if child.tail is not None), None)
+
+
+def _link_parts(cell):
+    """
+    Return the (href, text, class) of the links in a table cell.
+
+    Matches the per-row XPath this replaces: each part is taken from the
+    first link that has it, so e.g. an anchor without an href does not hide
+    the real link and text after a leading <img> is still found. Only the
+    row's direct <td> children are considered as cells.
+
+    Args:
+        cell (lxml.html.HtmlElement): Table cell, or None for a missing cell
+
+    Returns:
+        tuple: href, text and class, each None when not present
+    """
+    if cell is None:
+        return None, None, None
+
+    links = list(cell.iter("a"))
+    href = next((a.get("href") for a in links if a.get("href") is not None), None)
+    text = next((t for t in map(_link_text, links) if t is not None), None)
+    class_name = next(
+        (a.get("class") for a in links if a.get("class") is not None), None
+    )
+    return href, text, class_name
+
+
+def _join_link(base_url, link):
+    """Resolve a row link against the page URL, leaving postback links untouched."""
+    if link is None or link.startswith("javascript:"):
+        return link
+    return urljoin(base_url, link)
+
+
+def _decode_header(value):
+    """
+    Decode a raw header value.
+
+    Servers commonly send filenames as raw UTF-8, so that is tried first;
+    anything else falls back to ISO-8859-1 (RFC 7230), which never fails.
+    """
+    try:
+        return value.decode()
+    except UnicodeDecodeError:
+        return value.decode("latin-1")
+
+
+def _persist(body, content_disposition, content_type, fallback_name, folder):
+    """
+    Name a downloaded file and write it to disk.
+
+    Runs in a reactor worker thread, so it must not touch the spider or
+    response objects.
+
+    Args:
+        body (bytes): File contents
+        content_disposition (str): Decoded Content-Disposition header
+        content_type (str): Decoded Content-Type header
+        fallback_name (str): Name to use when the headers carry no filename
+        folder (pathlib.Path): Existing directory the file is saved in
+
+    Returns:
+        pathlib.Path: Path of the written file
+    """
+    file_name = None
+
+    if "filename=" in content_disposition:
+        file_name = _RE_FILENAME.search(content_disposition)
+        file_name = file_name.group(1) if file_name else None
+
+    if not file_name:
+        file_name = fallback_name
+
+    file_name = _RE_UNSAFE_CHARS.sub("_", file_name)
+
+    if not os.path.splitext(file_name)[1]:
+        ext = mimetypes.guess_extension(content_type.split(";")[0])
+        if ext:
+            file_name += ext
+
+    file_path = folder / file_name
+    file_path.write_bytes(body)
+    return file_path
+
 
 class BWPipelinesSpider(scrapy.Spider):
     """
@@ -36,6 +156,10 @@ class BWPipelinesSpider(scrapy.Spider):
             }
         },
         "DOWNLOAD_DELAY": 5,
+        "RANDOMIZE_DOWNLOAD_DELAY": True,
+        "CONCURRENT_REQUESTS_PER_DOMAIN": 1,
+        "AUTOTHROTTLE_ENABLED": True,
+        "AUTOTHROTTLE_START_DELAY": 5,
         "DOWNLOAD_DIR": "downloads",
     }
 
@@ -48,7 +172,11 @@ class BWPipelinesSpider(scrapy.Spider):
         self.from_page = int(from_page)
         self.to_page = int(to_page)
         self.download_delay = self.custom_settings["DOWNLOAD_DELAY"]
-        self.download_folder = self.custom_settings["DOWNLOAD_DIR"]
+        self.download_folder = Path(self.custom_settings["DOWNLOAD_DIR"])
+        if settings.ALLOW_FILE_DOWNLOAD:
+            self.download_folder.mkdir(parents=True, exist_ok=True)
+        # Load the MIME database up front rather than on the first download
+        mimetypes.init()
 
     def start_requests(self):
         start_page = 1
@@ -66,56 +194,56 @@ class BWPipelinesSpider(scrapy.Spider):
             response (scrapy.http.Response): Response object containing page HTML
 
         Yields:
-            scrapy.FormRequest: Requests for file downloads and next page navigation
+            scrapy.Request: Postback requests for file downloads and next page navigation
         """
         page_number = response.meta.get("page_number", 1)
 
-        hidden_inputs = response.xpath("//input[@type='hidden']")
-        form_data = {
-            field.attrib["name"]: field.attrib.get("value", "")
-            for field in hidden_inputs
-        }
+        # The hidden fields (including the large __VIEWSTATE) are encoded once
+        # per page and shared by every postback request built from this page
+        form_body = urlencode(
+            [
+                (field.get("name"), field.get("value", ""))
+                for field in _HIDDEN_INPUTS(response.selector.root)
+                if field.get("name") not in (None, "__EVENTTARGET", "__EVENTARGUMENT")
+            ]
+        )
 
         if self.from_page <= page_number < self.to_page:
-            table_rows = response.xpath(
-                "//table[@id='dgITMatrix']/tr[starts-with(@id, 'dgITMatrix_')]"
-            )
+            table_rows = _TABLE_ROWS(response.selector.root)
+            base_url = response.url
+
+            for index, node in enumerate(table_rows, start=1):
+                cells = list(node.iterchildren("td"))
+                date_cell = _cell(cells, 1)
 
-            for index, row in enumerate(table_rows, start=1):
-                pdf_link = row.xpath(".//td[1]//a/@href").get()
-                pdf_link = response.urljoin(pdf_link)
-                pdf_name = self._get_file_name(row, ".//td[1]//a")
+                pdf_link, pdf_text, pdf_class = _link_parts(_cell(cells, 0))
+                pdf_link = _join_link(base_url, pdf_link)
+                pdf_name = self._get_file_name(pdf_text, pdf_class)
 
-                posting_date = row.xpath(".//td[2]//text()").get()
-                posting_date = posting_date.strip()
-                excel_link = row.xpath(".//td[3]//a/@href").get()
-                excel_link = response.urljoin(excel_link)
-                excel_name = self._get_file_name(row, ".//td[3]//a")
+                posting_date = ""
+                if date_cell is not None:
+                    posting_date = next(date_cell.itertext(), "").strip()
+                excel_link, excel_text, excel_class = _link_parts(_cell(cells, 2))
+                excel_link = _join_link(base_url, excel_link)
+                excel_name = self._get_file_name(excel_text, excel_class)
 
-                pdf_args = self._extract_link_args(pdf_link)
-                excel_args = self._extract_link_args(excel_link)
+                pdf_args = extract_link_args(pdf_link)
+                excel_args = extract_link_args(excel_link)
 
                 if excel_link and settings.ALLOW_FILE_DOWNLOAD:
-                    time.sleep(self.settings.get("DOWNLOAD_DELAY"))
-                    excel_name = yield scrapy.FormRequest(
-                        url=response.url,
-                        formdata={
-                            **form_data,
-                            "__EVENTTARGET": excel_args[0],
-                            "__EVENTARGUMENT": excel_args[1],
-                        },
+                    yield self._postback_request(
+                        response,
+                        form_body,
+                        excel_args,
                         callback=self._download_file,
+                        meta={"file_name": excel_name},
                     )
 
                 if pdf_link and settings.ALLOW_FILE_DOWNLOAD:
-                    time.sleep(self.settings.get("DOWNLOAD_DELAY"))
-                    yield scrapy.FormRequest(
-                        url=response.url,
-                        formdata={
-                            **form_data,
-                            "__EVENTTARGET": pdf_args[0],
-                            "__EVENTARGUMENT": pdf_args[1],
-                        },
+                    yield self._postback_request(
+                        response,
+                        form_body,
+                        pdf_args,
                         callback=self._download_file,
                         meta={"file_name": pdf_name},
                     )
@@ -141,22 +269,46 @@ class BWPipelinesSpider(scrapy.Spider):
         if page_number >= self.to_page:
             return
 
-        next_page_href = response.xpath(
-            "//table[@id='dgITMatrix']//tr[1]//a[contains(translate(text(), 'ABCDEFGHIJKLMNOPQRSTUVWXYZ', 'abcdefghijklmnopqrstuvwxyz'), 'next')]/@href"
-        ).get()
+        next_page_href = _first(_NEXT_PAGE_HREF, response.selector.root)
 
-        next_page_args = self._extract_link_args(next_page_href)
-        form_data["__EVENTTARGET"] = next_page_args[0]
-        form_data["__EVENTARGUMENT"] = next_page_args[1]
+        next_page_args = extract_link_args(next_page_href)
 
-        yield scrapy.FormRequest(
-            url=response.url,
-            formdata=form_data,
+        yield self._postback_request(
+            response,
+            form_body,
+            next_page_args,
             callback=self.parse,
             meta={"page_number": page_number + 1},
         )
 
-    def _download_file(self, response):
+    def _postback_request(self, response, form_body, link_args, **kwargs):
+        """
+        Build an ASP.NET postback request for a link on the current page.
+
+        Appends the event target and argument to the page's pre-encoded hidden
+        form fields rather than re-encoding the whole form for every request.
+
+        Args:
+            response (scrapy.http.Response): Page the postback link was found on
+            form_body (str): URL-encoded hidden form fields of the page
+            link_args (tuple): Postback arguments extracted from the link
+            **kwargs: Extra arguments passed on to scrapy.Request
+
+        Returns:
+            scrapy.Request: POST request replaying the postback
+        """
+        event = urlencode(
+            {"__EVENTTARGET": link_args[0], "__EVENTARGUMENT": link_args[1]}
+        )
+        return scrapy.Request(
+            url=response.url,
+            method="POST",
+            body=f"{form_body}&{event}" if form_body else event,
+            headers={"Content-Type": "application/x-www-form-urlencoded"},
+            **kwargs,
+        )
+
+    async def _download_file(self, response):
         """
         Handle file download and save to local storage.
 
@@ -168,78 +320,38 @@ class BWPipelinesSpider(scrapy.Spider):
 
         Note:
             Files are saved in the download_folder directory with sanitized names
-            and appropriate extensions based on content type.
+            and appropriate extensions based on content type. Naming and writing
+            happen in a worker thread so the reactor keeps serving other requests.
         """
 
-        content_disposition = response.headers.get("Content-Disposition", b"").decode()
-        file_name = None
-
-        if "filename=" in content_disposition:
-            file_name = re.search(
-                r'filename\*?=["\']?(?:UTF-8\'\')?([^"\']+)', content_disposition
+        headers = response.headers
+        content_disposition = _decode_header(headers.get("Content-Disposition", b""))
+        content_type = _decode_header(headers.get("Content-Type", b""))
+
+        file_path = await maybe_deferred_to_future(
+            deferToThread(
+                _persist,
+                response.body,
+                content_disposition,
+                content_type,
+                response.meta.get("file_name", "downloaded_file"),
+                self.download_folder,
             )
-            file_name = file_name.group(1) if file_name else None
-
-        if not file_name:
-            file_name = response.meta.get("file_name", "downloaded_file")
-
-        file_name = re.sub(r'[\\/:"*?<>|]', "_", file_name)
-
-        content_type = response.headers.get("Content-Type", b"").decode()
-        if not os.path.splitext(file_name)[1]:
-            ext = mimetypes.guess_extension(content_type.split(";")[0])
-            if ext:
-                file_name += ext
-
-        file_path = os.path.join(self.download_folder, file_name)
-
-        with open(file_path, "wb") as f:
-            f.write(response.body)
+        )
 
         self.logger.info(f"Downloaded file: {file_path}")
-        yield file_name
 
-    def _get_file_name(self, element, xpath_base):
+    def _get_file_name(self, text, class_name):
         """
-        Extract and combine text and class attributes for filename creation.
+        Combine link text and class attributes for filename creation.
 
         Args:
-            element (scrapy.Selector): Element containing the file information
-            xpath_base (str): Base XPath expression for finding text and class
+            text (str): Text of the file link, may be None
+            class_name (str): Class attribute of the file link, may be None
 
         Returns:
             str: Combined filename from text and class attributes, joined with dots
         """
-        text = (element.xpath(f"{xpath_base}/text()").get() or "").strip()
-        class_name = (element.xpath(f"{xpath_base}/@class").get() or "").strip()
+        text = (text or "").strip()
+        class_name = (class_name or "").strip()
         return ".".join(filter(None, [text, class_name]))
-
-    def _extract_link_args(self, js_code):
-        """
-        Extract arguments from JavaScript postback functions in links.
-
-        Parses both WebForm_PostBackOptions and __doPostBack JavaScript
-        function calls to extract their arguments.
-
-        Args:
-            js_code (str): JavaScript link containing postback function call
-
-        Returns:
-            list: Extracted and cleaned arguments from the JavaScript function
-                 Returns empty list if no arguments found
-        """
-        if not js_code:
-            return []
-
-        match = re.search(
-            r"javascript:WebForm_DoPostBackWithOptions\(new WebForm_PostBackOptions\((.*)\)\)",
-            js_code,
-        )
-        if not match:
-            match = re.search(r"javascript:__doPostBack\((.*)\)", js_code)
-
-        args = []
-        if match:
-            args = [arg.strip("\"' ") for arg in match.group(1).split(",")]
-
-        return args
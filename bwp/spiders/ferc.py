@@ -1,6 +1,6 @@
-import re
 import scrapy
 
+from bwp.aspx import extract_link_args
 from bwp.items import FercItem
 
 
@@ -42,7 +42,7 @@ class FercSpider(scrapy.Spider):
         form_view_link = response.xpath(
             "//table[@id='tableLeftMenu']//td[@id='item1Data']//a/@href"
         ).get()
-        form_view_args = self._extract_link_args(form_view_link)
+        form_view_args = extract_link_args(form_view_link)
 
         yield scrapy.FormRequest(
             url=response.url,
@@ -70,28 +70,3 @@ class FercSpider(scrapy.Spider):
 
         else:
             self.log("Checksum not found on the page")
-
-    def _extract_link_args(self, js_code):
-        """
-        Extract arguments from JavaScript postback functions in links.
-
-        Parses both WebForm_PostBackOptions and __doPostBack JavaScript
-        function calls to extract their arguments.
-
-        Args:
-            js_code (str): JavaScript link containing postback function call
-
-        Returns:
-            list: Extracted and cleaned arguments from the JavaScript function
-                 Returns empty list if no arguments found
-        """
-        if not js_code:
-            return []
-
-        match = re.search(r"javascript:__doPostBack\((.*)\)", js_code)
-
-        args = []
-        if match:
-            args = [arg.strip("\"' ") for arg in match.group(1).split(",")]
-
-        return args